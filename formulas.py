@@ -1,4 +1,5 @@
 import math
+from schema import command
 G = 6.674e-11  # Newtonian constant of gravitation (m^3 kg^-1 s^-2)
 c = 3.0e8    # Speed of light (m/s)
 M_sun = 1.989e30 # Solar mass (kg)
@@ -19,20 +20,10 @@ def _stefan_boltzmann(T, emissivity=1.0):
     """
     return emissivity * STEFAN_BOLTZMANN_CONSTANT * (T ** 4)
 
-def stefan_boltzmann(args=[]):
-    temp = input("Temperature in Kelvin [number]: ")
-    try:
-        temp = float(temp)
-    except Exception as e:
-        print("Error:", e)
-        return
-
-    emissivity = input("Emissivity (1 = blackbody, default 1) [0-1]: ")
-    if not emissivity:
-        emissivity = 1
-    float(emissivity)
-
-    print("Radiated Power:", str(_stefan_boltzmann(temp, emissivity)), "W/m^2")
+stefan_boltzmann = command(_stefan_boltzmann, [
+    {"name": "T", "type": float, "unit": "K", "min": 0},
+    {"name": "emissivity", "type": float, "unit": "0-1", "default": 1.0, "min": 0, "max": 1},
+], "Radiated Power", "W/m^2")
 
 def distance_modulus(m=None, M=None, d=None):
     """
@@ -167,10 +158,100 @@ def roche_lobe_distance(R, rho_primary, rho_object):
     """
     return 2.4 * R * (rho_primary / rho_object) ** (1/3)
 
+def _distance_modulus_label(m, M, d):
+    # distance_modulus solves for whichever argument was left out
+    if d is None:
+        return "Distance", "pc"
+    if M is None:
+        return "Absolute Magnitude", "mag"
+    return "Apparent Magnitude", "mag"
+
 exports = {
     "stefan_boltzmann": {
         "cb": stefan_boltzmann,
         "desc": "Calculate the radiated power per unit area using the Stefan–Boltzmann law",
         "aliases": ["stefanboltzman", "boltzman", "radiationpower", "blackbody"],
-    }
+    },
+    "distance_modulus": {
+        "cb": command(distance_modulus, [
+            {"name": "m", "type": float, "default": None},
+            {"name": "M", "type": float, "default": None},
+            {"name": "d", "type": float, "unit": "pc", "default": None, "gt": 0},
+        ], _distance_modulus_label),
+        "desc": "Solve the distance modulus for whichever of m, M, d is left out (use - to skip one)",
+        "aliases": ["distmod", "magnitude", "modulus"],
+    },
+    "schwarzschild_radius": {
+        "cb": command(schwarzschild_radius, [
+            {"name": "mass", "type": float, "unit": "kg", "min": 0},
+        ], "Schwarzschild Radius", "m"),
+        "desc": "Calculate the Schwarzschild radius for a given mass",
+        "aliases": ["schwarzschild", "eventhorizon", "blackhole"],
+    },
+    "orbital_period": {
+        "cb": command(orbital_period_kepler, [
+            {"name": "semimajor_axis", "type": float, "unit": "m", "min": 0},
+            {"name": "m1", "type": float, "unit": "kg", "gt": 0},
+            {"name": "m2", "type": float, "unit": "kg", "min": 0},
+        ], "Orbital Period", "s"),
+        "desc": "Calculate the orbital period using Newton's form of Kepler's Third Law",
+        "aliases": ["kepler", "period"],
+    },
+    "redshift": {
+        "cb": command(calculate_redshift_z, [
+            {"name": "observed_wavelength", "type": float, "min": 0},
+            {"name": "rest_wavelength", "type": float, "gt": 0},
+        ], "Redshift z"),
+        "desc": "Calculate the redshift parameter z from observed and rest wavelengths (same unit)",
+        "aliases": ["z", "redshift_z"],
+    },
+    "velocity_from_redshift": {
+        "cb": command(calculate_velocity_from_redshift, [
+            {"name": "z", "type": float, "gt": -1},
+        ], "Velocity", "m/s"),
+        "desc": "Calculate the relativistic velocity from the redshift parameter z",
+        "aliases": ["redshiftvelocity", "recession"],
+    },
+    "vis_viva": {
+        "cb": command(calculate_vis_viva_velocity, [
+            {"name": "distance_r", "type": float, "unit": "m", "gt": 0},
+            {"name": "semi_major_axis_a", "type": float, "unit": "m", "gt": 0},
+            {"name": "central_mass_M", "type": float, "unit": "kg", "min": 0},
+        ], "Orbital Velocity", "m/s"),
+        "desc": "Calculate the orbital velocity using the vis-viva equation",
+        "aliases": ["visviva", "orbitalvelocity"],
+    },
+    "flux": {
+        "cb": command(calculate_flux, [
+            {"name": "luminosity_L", "type": float, "unit": "W", "min": 0},
+            {"name": "distance_d", "type": float, "unit": "m", "gt": 0},
+        ], "Flux", "W/m^2"),
+        "desc": "Calculate apparent flux from luminosity and distance",
+        "aliases": ["apparentflux"],
+    },
+    "luminosity": {
+        "cb": command(calculate_luminosity, [
+            {"name": "flux_F", "type": float, "unit": "W/m^2", "min": 0},
+            {"name": "distance_d", "type": float, "unit": "m", "min": 0},
+        ], "Luminosity", "W"),
+        "desc": "Calculate intrinsic luminosity from apparent flux and distance",
+        "aliases": ["lum"],
+    },
+    "distance": {
+        "cb": command(calculate_distance, [
+            {"name": "flux_F", "type": float, "unit": "W/m^2", "gt": 0},
+            {"name": "luminosity_L", "type": float, "unit": "W", "min": 0},
+        ], "Distance", "m"),
+        "desc": "Calculate distance from apparent flux and luminosity",
+        "aliases": ["dist", "luminositydistance"],
+    },
+    "roche_lobe": {
+        "cb": command(roche_lobe_distance, [
+            {"name": "R", "type": float, "min": 0},
+            {"name": "rho_primary", "type": float, "min": 0},
+            {"name": "rho_object", "type": float, "gt": 0},
+        ], "Roche-lobe Distance"),
+        "desc": "Calculate the Roche-lobe distance (returned in the units of R; densities in matching units)",
+        "aliases": ["roche", "rochelimit"],
+    },
 }
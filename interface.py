@@ -1,6 +1,7 @@
 import difflib
 import requests
 import json
+from schema import usage
 
 class Interface:
     def __init__(self, commands={}, cutoff=0.6):
@@ -12,6 +13,9 @@ class Interface:
                 "aliases": ["name1"]
             }
         }
+
+        A callback may carry an argument schema as `callback.schema`
+        (see schema.command), which help shows as the command's signature.
         """
 
         self.commands = commands
@@ -116,7 +120,9 @@ Please process the following query: "[[query]]".
         for name, meta in self.commands.items():
             aliases = meta.get("aliases", [])
             alias_str = f" (aliases: {', '.join(aliases)})" if aliases else ""
-            all_help_lines.append(f"- {name}: {meta.get('desc', '')}{alias_str}")
+            schema = getattr(meta.get("cb"), "schema", None)
+            args_str = f" (args: {usage(schema)})" if schema else ""
+            all_help_lines.append(f"- {name}: {meta.get('desc', '')}{args_str}{alias_str}")
 
         # No args: output the full index
         if not args:
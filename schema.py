@@ -0,0 +1,171 @@
+import math
+from itertools import zip_longest
+
+# Placeholder for skipping an optional argument on the command line,
+# e.g. `distance_modulus 10 - 100` leaves M unset.
+OMIT = "-"
+
+def _compile_field(spec):
+    """
+    Builds the converter for a single argument spec once, so each value only
+    pays for the type conversion and range checks.
+
+    Spec keys:
+        name (str): Argument name
+        type (callable): Converter applied to the raw value (default float)
+        unit (str): Unit shown in usage text (optional)
+        default: Value used when the argument is omitted (optional)
+        min / max: Inclusive bounds checked after conversion (optional)
+        gt / lt: Exclusive bounds, e.g. for divisors that must not be 0 (optional)
+    """
+    name = spec["name"]
+    convert = spec.get("type", float)
+    type_name = getattr(convert, "__name__", repr(convert))
+    optional = "default" in spec
+    default = spec.get("default")
+    lo = spec.get("min")
+    hi = spec.get("max")
+    gt = spec.get("gt")
+    lt = spec.get("lt")
+    bounded = any(bound is not None for bound in (lo, hi, gt, lt))
+
+    def field(raw):
+        if raw is None or raw == OMIT:
+            if optional:
+                return default
+            raise ValueError(f"{name} is required")
+        try:
+            value = convert(raw)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be a {type_name}, got {raw!r}")
+        if bounded and math.isnan(value):
+            raise ValueError(f"{name} must be a number, got {value}")
+        if lo is not None and value < lo:
+            raise ValueError(f"{name} must be >= {lo}, got {value}")
+        if hi is not None and value > hi:
+            raise ValueError(f"{name} must be <= {hi}, got {value}")
+        if gt is not None and value <= gt:
+            raise ValueError(f"{name} must be > {gt}, got {value}")
+        if lt is not None and value >= lt:
+            raise ValueError(f"{name} must be < {lt}, got {value}")
+        return value
+
+    return field
+
+def usage(schema):
+    """
+    Formats a schema as a one-line signature, e.g. `T[K] [emissivity=1.0]`.
+    """
+    parts = []
+    for spec in schema:
+        part = spec["name"]
+        if spec.get("unit"):
+            part += f"[{spec['unit']}]"
+        if "default" in spec:
+            part = f"[{part}={spec['default']}]"
+        parts.append(part)
+    return " ".join(parts)
+
+def _is_column(col):
+    # Any iterable except text counts as an argument array
+    if isinstance(col, (str, bytes)):
+        return False
+    try:
+        iter(col)
+    except TypeError:
+        return False
+    return True
+
+def _convert_column(field, col):
+    values = []
+    for i, raw in enumerate(col):
+        try:
+            values.append(field(raw))
+        except ValueError as e:
+            raise ValueError(f"[{i}] {e}")
+    return values
+
+def compile_schema(schema):
+    """
+    Compiles an argument schema into two parsers:
+
+        parse(args): converts one positional argument list into typed values,
+            filling in defaults for omitted optional arguments.
+        parse_columns(columns): converts one value or one iterable of values
+            per argument into equal-length typed columns, broadcasting scalars.
+
+    Raises ValueError on missing, extra or invalid arguments; errors from
+    parse_columns are prefixed with the row index, e.g. `[3] T must be >= 0`.
+    """
+    fields = [_compile_field(spec) for spec in schema]
+    required = sum(1 for spec in schema if "default" not in spec)
+    signature = usage(schema)
+
+    def check_count(count):
+        if count < required or count > len(fields):
+            raise ValueError(f"expected arguments: {signature}")
+
+    def parse(args):
+        args = list(args)
+        check_count(len(args))
+        return [field(raw) for field, raw in zip_longest(fields, args)]
+
+    def parse_columns(columns):
+        columns = [list(col) if _is_column(col) else col for col in columns]
+        check_count(len(columns))
+        sizes = {len(col) for col in columns if isinstance(col, list)}
+        if len(sizes) > 1:
+            raise ValueError(f"argument arrays differ in length: {sorted(sizes)}")
+        n = sizes.pop() if sizes else 1
+        out = []
+        for field, col in zip_longest(fields, columns):
+            if isinstance(col, list):
+                out.append(_convert_column(field, col))
+            else:
+                out.append([field(col)] * n)
+        return out
+
+    return parse, parse_columns
+
+def command(fn, schema, label, unit=""):
+    """
+    Wraps a positional formula `fn` as an Interface callback driven by
+    `schema`. The schema is compiled once here; the returned callback only
+    parses the arguments it is given and never prompts.
+
+    `label` is either a string printed before the result, or a callable
+    taking the parsed arguments and returning a (label, unit) pair.
+
+    The callback also exposes:
+        cb.schema: the argument schema, shown by help and the nlp prompt
+        cb.call(*args): parse one argument list and return the result
+        cb.batch(*columns): evaluate `fn` over whole argument arrays in one
+            call. numpy is not a dependency, so the columns are validated
+            once up front and `fn` is then mapped over the rows in Python
+            rather than applied as an array operation.
+    """
+    parse, parse_columns = compile_schema(schema)
+
+    def call(*args):
+        return fn(*parse(args))
+
+    def batch(*columns):
+        return list(map(fn, *parse_columns(columns)))
+
+    def cb(args=[]):
+        try:
+            values = parse(args)
+            result = fn(*values)
+        except Exception as e:
+            print("Error:", e)
+            return
+        name, suffix = label(*values) if callable(label) else (label, unit)
+        if suffix:
+            print(f"{name}:", str(result), suffix)
+        else:
+            print(f"{name}:", str(result))
+
+    cb.schema = schema
+    cb.call = call
+    cb.batch = batch
+    return cb
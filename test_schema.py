@@ -0,0 +1,92 @@
+import math
+
+import pytest
+
+from schema import OMIT, command, compile_schema
+
+SCHEMA = [
+    {"name": "x", "type": float, "min": 0},
+    {"name": "y", "type": float, "default": 2.0, "gt": 0},
+    {"name": "z", "type": float, "default": None},
+]
+
+parse, parse_columns = compile_schema(SCHEMA)
+
+def test_parse_converts_and_fills_defaults():
+    assert parse(["1.5"]) == [1.5, 2.0, None]
+    assert parse([1, "3", "4"]) == [1.0, 3.0, 4.0]
+
+def test_parse_omit_placeholder_uses_default():
+    assert parse(["1", OMIT, "4"]) == [1.0, 2.0, 4.0]
+
+def test_parse_none_only_allowed_for_optional_fields():
+    assert parse([1, None]) == [1.0, 2.0, None]
+    with pytest.raises(ValueError, match="x is required"):
+        parse([None])
+    with pytest.raises(ValueError, match="x is required"):
+        parse([OMIT])
+
+def test_parse_argument_count():
+    with pytest.raises(ValueError, match="expected arguments"):
+        parse([])
+    with pytest.raises(ValueError, match="expected arguments"):
+        parse([1, 2, 3, 4])
+
+def test_parse_bounds():
+    with pytest.raises(ValueError, match="x must be >= 0"):
+        parse(["-1"])
+    with pytest.raises(ValueError, match="y must be > 0"):
+        parse(["1", "0"])
+
+def test_parse_rejects_nan_only_on_bounded_fields():
+    with pytest.raises(ValueError, match="x must be a number"):
+        parse(["nan"])
+    with pytest.raises(ValueError, match="y must be a number"):
+        parse(["1", "nan"])
+    assert math.isnan(parse(["1", "1", "nan"])[2])
+
+def test_parse_bad_type():
+    with pytest.raises(ValueError, match="x must be a float"):
+        parse(["abc"])
+
+def test_parse_columns_broadcasts_scalars():
+    assert parse_columns([[1, 2, 3], 5]) == [
+        [1.0, 2.0, 3.0],
+        [5.0, 5.0, 5.0],
+        [None, None, None],
+    ]
+    assert parse_columns([1]) == [[1.0], [2.0], [None]]
+
+def test_parse_columns_accepts_any_iterable():
+    assert parse_columns([range(3), (v for v in [1, 2, 3])])[:2] == [
+        [0.0, 1.0, 2.0],
+        [1.0, 2.0, 3.0],
+    ]
+
+def test_parse_columns_length_mismatch():
+    with pytest.raises(ValueError, match="differ in length"):
+        parse_columns([[1, 2], [1, 2, 3]])
+
+def test_parse_columns_reports_row_index():
+    with pytest.raises(ValueError, match=r"\[2\] x must be >= 0"):
+        parse_columns([[1, 2, -3]])
+    with pytest.raises(ValueError, match="x is required"):
+        parse_columns([None])
+
+def test_command_batch_end_to_end(capsys):
+    cb = command(lambda x, y, z: x * y, SCHEMA, "Product", "m")
+    assert cb.schema is SCHEMA
+    assert cb.call("3") == 6.0
+    assert cb.batch(range(4), [1, 2, 3, 4]) == [0.0, 2.0, 6.0, 12.0]
+
+    cb(["3", "2"])
+    assert capsys.readouterr().out == "Product: 6.0 m\n"
+
+def test_command_without_unit_has_no_trailing_space(capsys):
+    command(lambda x, y, z: x, SCHEMA, "Value")(["1"])
+    assert capsys.readouterr().out == "Value: 1.0\n"
+
+def test_command_callable_label(capsys):
+    cb = command(lambda x, y, z: x, SCHEMA, lambda x, y, z: ("Solved", "pc"))
+    cb(["1"])
+    assert capsys.readouterr().out == "Solved: 1.0 pc\n"
@@ -1,13 +1,11 @@
 import re
 import math
+from schema import compile_schema
 
 def convert_and_print(args=[]):
-    if len(args) != 1:
-        print("Error: please provide an argument for what you want to convert")
-        print("For example: `convert 23kg`")
-        return
     try:
-        _convert_and_print(args[0])
+        qty_str, = _parse_convert_args(args)
+        _convert_and_print(qty_str)
     except Exception as e:
         print("Error:", e)
 
@@ -254,6 +252,11 @@ def _convert_and_print(qty_str):
         val_in_tgt = value_si / tgt_to_si
         print(f"{tgt}: {fmt_sig4(val_in_tgt)}")
 
+convert_and_print.schema = [
+    {"name": "quantity", "type": str, "unit": "value+unit, e.g. 23kg"},
+]
+_parse_convert_args, _ = compile_schema(convert_and_print.schema)
+
 exports = {
     "convert_units": {
         "cb": convert_and_print,